@@ -1,8 +1,10 @@
 """REST API endpoints for Pokemon Battle application."""
 
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from pokemon_battle import __version__
@@ -14,6 +16,7 @@ from pokemon_battle.exceptions import (
     PokemonNotFoundError,
     SamePokemonError,
 )
+from pokemon_battle.models import Battle, Pokemon
 from pokemon_battle.pokeapi import get_pokeapi_client
 from pokemon_battle.protocols import BattleEngine, PokemonProvider
 from pokemon_battle.schemas import (
@@ -22,6 +25,7 @@ from pokemon_battle.schemas import (
     BattleResponse,
     ErrorResponse,
     HealthResponse,
+    PokemonName,
     PokemonResponse,
 )
 from pokemon_battle.services import BattleService, PokemonService
@@ -71,33 +75,84 @@ def handle_pokemon_error(error: PokemonBattleError) -> HTTPException:
     )
 
 
-# Health check endpoint
+# Serialization helpers
+def pokemon_to_dict(pokemon: Pokemon) -> dict[str, Any]:
+    """Convert a Pokemon row into a plain dict matching PokemonResponse."""
+    return {
+        "id": pokemon.id,
+        "pokeapi_id": pokemon.pokeapi_id,
+        "name": pokemon.name,
+        "hp": pokemon.hp,
+        "attack": pokemon.attack,
+        "defense": pokemon.defense,
+        "special_attack": pokemon.special_attack,
+        "special_defense": pokemon.special_defense,
+        "speed": pokemon.speed,
+        "types": pokemon.types,
+        "sprite_url": pokemon.sprite_url,
+        "created_at": pokemon.created_at,
+    }
+
+
+def battle_summary_to_dict(battle: Battle) -> dict[str, Any]:
+    """Convert a Battle row into a plain dict matching BattleListResponse."""
+    return {
+        "id": battle.id,
+        "pokemon1_name": battle.pokemon1.name,
+        "pokemon2_name": battle.pokemon2.name,
+        "winner_name": battle.winner.name if battle.winner else None,
+        "pokemon1_score": battle.pokemon1_score,
+        "pokemon2_score": battle.pokemon2_score,
+        "created_at": battle.created_at,
+    }
+
+
+def battle_to_dict(battle: Battle) -> dict[str, Any]:
+    """Convert a Battle row with its Pokemon loaded into a dict matching BattleResponse."""
+    return {
+        "id": battle.id,
+        "pokemon1": pokemon_to_dict(battle.pokemon1),
+        "pokemon2": pokemon_to_dict(battle.pokemon2),
+        "winner": pokemon_to_dict(battle.winner) if battle.winner else None,
+        "pokemon1_score": battle.pokemon1_score,
+        "pokemon2_score": battle.pokemon2_score,
+        "battle_log": battle.battle_log,
+        "created_at": battle.created_at,
+    }
+
+
+# Health check endpoint; the body never changes, so it is encoded once at import
+_HEALTH_BODY = orjson.dumps(HealthResponse(status="healthy", version=__version__).model_dump())
+
+
 @router.get(
     "/health",
-    response_model=HealthResponse,
+    response_model=None,
     tags=["Health"],
     summary="Health check",
+    responses={200: {"model": HealthResponse, "description": "Successful Response"}},
 )
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """Check if the API is running."""
-    return HealthResponse(status="healthy", version=__version__)
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 # Pokemon endpoints
 @router.get(
     "/pokemon/{name}",
-    response_model=PokemonResponse,
+    response_model=None,
     tags=["Pokemon"],
     summary="Get Pokemon by name",
     responses={
+        200: {"model": PokemonResponse, "description": "Successful Response"},
         404: {"model": ErrorResponse, "description": "Pokemon not found"},
         502: {"model": ErrorResponse, "description": "PokeAPI error"},
     },
 )
 async def get_pokemon(
-    name: str,
+    name: PokemonName,
     pokemon_service: Annotated[PokemonService, Depends(get_pokemon_service)],
-) -> PokemonResponse:
+) -> ORJSONResponse:
     """
     Get Pokemon data by name.
 
@@ -106,35 +161,37 @@ async def get_pokemon(
     """
     try:
         pokemon = await pokemon_service.get_or_fetch_pokemon(name)
-        return PokemonResponse.model_validate(pokemon)
+        return ORJSONResponse(pokemon_to_dict(pokemon))
     except PokemonBattleError as e:
         raise handle_pokemon_error(e) from e
 
 
 @router.get(
     "/pokemon",
-    response_model=list[PokemonResponse],
+    response_model=None,
     tags=["Pokemon"],
     summary="List all Pokemon",
+    responses={200: {"model": list[PokemonResponse], "description": "Successful Response"}},
 )
 async def list_pokemon(
     pokemon_service: Annotated[PokemonService, Depends(get_pokemon_service)],
     limit: Annotated[int, Query(ge=1, le=100)] = 100,
     offset: Annotated[int, Query(ge=0)] = 0,
-) -> list[PokemonResponse]:
+) -> ORJSONResponse:
     """List all Pokemon stored in the database."""
     pokemon_list = await pokemon_service.list_pokemon(limit=limit, offset=offset)
-    return [PokemonResponse.model_validate(p) for p in pokemon_list]
+    return ORJSONResponse([pokemon_to_dict(p) for p in pokemon_list])
 
 
 # Battle endpoints
 @router.post(
     "/battles",
-    response_model=BattleResponse,
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
     tags=["Battles"],
     summary="Start a new battle",
     responses={
+        201: {"model": BattleResponse, "description": "Successful Response"},
         400: {"model": ErrorResponse, "description": "Invalid battle request"},
         404: {"model": ErrorResponse, "description": "Pokemon not found"},
         502: {"model": ErrorResponse, "description": "PokeAPI error"},
@@ -143,7 +200,7 @@ async def list_pokemon(
 async def create_battle(
     request: BattleRequest,
     battle_service: Annotated[BattleService, Depends(get_battle_service)],
-) -> BattleResponse:
+) -> ORJSONResponse:
     """
     Start a battle between two Pokemon.
 
@@ -155,31 +212,25 @@ async def create_battle(
             request.pokemon1_name,
             request.pokemon2_name,
         )
-        return BattleResponse(
-            id=battle.id,
-            pokemon1=PokemonResponse.model_validate(battle.pokemon1),
-            pokemon2=PokemonResponse.model_validate(battle.pokemon2),
-            winner=PokemonResponse.model_validate(battle.winner) if battle.winner else None,
-            pokemon1_score=battle.pokemon1_score,
-            pokemon2_score=battle.pokemon2_score,
-            battle_log=battle.battle_log,
-            created_at=battle.created_at,
-        )
+        return ORJSONResponse(battle_to_dict(battle), status_code=status.HTTP_201_CREATED)
     except PokemonBattleError as e:
         raise handle_pokemon_error(e) from e
 
 
 @router.get(
     "/battles/{battle_id}",
-    response_model=BattleResponse,
+    response_model=None,
     tags=["Battles"],
     summary="Get battle by ID",
-    responses={404: {"model": ErrorResponse, "description": "Battle not found"}},
+    responses={
+        200: {"model": BattleResponse, "description": "Successful Response"},
+        404: {"model": ErrorResponse, "description": "Battle not found"},
+    },
 )
 async def get_battle(
     battle_id: int,
     battle_service: Annotated[BattleService, Depends(get_battle_service)],
-) -> BattleResponse:
+) -> ORJSONResponse:
     """Get a specific battle by its ID."""
     battle = await battle_service.get_battle(battle_id)
     if battle is None:
@@ -187,40 +238,21 @@ async def get_battle(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Battle with id {battle_id} not found",
         )
-    return BattleResponse(
-        id=battle.id,
-        pokemon1=PokemonResponse.model_validate(battle.pokemon1),
-        pokemon2=PokemonResponse.model_validate(battle.pokemon2),
-        winner=PokemonResponse.model_validate(battle.winner) if battle.winner else None,
-        pokemon1_score=battle.pokemon1_score,
-        pokemon2_score=battle.pokemon2_score,
-        battle_log=battle.battle_log,
-        created_at=battle.created_at,
-    )
+    return ORJSONResponse(battle_to_dict(battle))
 
 
 @router.get(
     "/battles",
-    response_model=list[BattleListResponse],
+    response_model=None,
     tags=["Battles"],
     summary="List all battles",
+    responses={200: {"model": list[BattleListResponse], "description": "Successful Response"}},
 )
 async def list_battles(
     battle_service: Annotated[BattleService, Depends(get_battle_service)],
     limit: Annotated[int, Query(ge=1, le=100)] = 100,
     offset: Annotated[int, Query(ge=0)] = 0,
-) -> list[BattleListResponse]:
+) -> ORJSONResponse:
     """List all battles with summary information."""
     battles = await battle_service.list_battles(limit=limit, offset=offset)
-    return [
-        BattleListResponse(
-            id=b.id,
-            pokemon1_name=b.pokemon1.name,
-            pokemon2_name=b.pokemon2.name,
-            winner_name=b.winner.name if b.winner else None,
-            pokemon1_score=b.pokemon1_score,
-            pokemon2_score=b.pokemon2_score,
-            created_at=b.created_at,
-        )
-        for b in battles
-    ]
+    return ORJSONResponse([battle_summary_to_dict(b) for b in battles])
@@ -29,9 +29,13 @@ This algorithm balances raw stats with strategic type matchups, similar to
 actual Pokemon games but simplified for a single-turn resolution.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple
 
-from pokemon_battle.models import Pokemon
+from pokemon_battle.models import POKEMON_TYPES, Pokemon
+from pokemon_battle.protocols import PokemonStats
 
 # Type effectiveness chart (attacking_type -> defending_type -> multiplier)
 TYPE_CHART: dict[str, dict[str, float]] = {
@@ -161,6 +165,19 @@ TYPE_CHART: dict[str, dict[str, float]] = {
     },
 }
 
+# Dense type chart indexed like POKEMON_TYPES (attacking_type_id -> defending_type_id)
+TYPE_MATRIX: tuple[tuple[float, ...], ...] = tuple(
+    tuple(float(TYPE_CHART[atk_type].get(def_type, 1.0)) for def_type in POKEMON_TYPES)
+    for atk_type in POKEMON_TYPES
+)
+
+# Flattened type chart keyed by (attacking_type, defending_type); missing pairs are neutral
+TYPE_PAIR_CHART: dict[tuple[str, str], float] = {
+    (atk_type, def_type): float(multiplier)
+    for atk_type, atk_chart in TYPE_CHART.items()
+    for def_type, multiplier in atk_chart.items()
+}
+
 
 @dataclass
 class BattleResult:
@@ -173,6 +190,70 @@ class BattleResult:
     is_draw: bool
 
 
+class BattleStats(NamedTuple):
+    """Immutable snapshot of the Pokemon fields that decide a battle."""
+
+    name: str
+    types: str
+    type_ids: tuple[int, ...]
+    hp: int
+    attack: int
+    defense: int
+    special_attack: int
+    special_defense: int
+    speed: int
+    base_power: float
+
+
+def get_battle_stats(pokemon: PokemonStats) -> BattleStats:
+    """
+    Take a hashable snapshot of a Pokemon's battle-relevant fields.
+
+    The database computes base_power for stored rows. It is only calculated
+    here for Pokemon that haven't been flushed yet.
+    """
+    base_power = pokemon.base_power
+    if base_power is None:
+        base_power = calculate_base_power(pokemon)
+
+    return BattleStats(
+        name=pokemon.name,
+        types=pokemon.types,
+        type_ids=pokemon.type_ids,
+        hp=pokemon.hp,
+        attack=pokemon.attack,
+        defense=pokemon.defense,
+        special_attack=pokemon.special_attack,
+        special_defense=pokemon.special_defense,
+        speed=pokemon.speed,
+        base_power=base_power,
+    )
+
+
+def get_type_effectiveness_by_ids(
+    attacker_type_ids: Sequence[int],
+    defender_type_ids: Sequence[int],
+) -> float:
+    """
+    Calculate type effectiveness multiplier from type indices.
+
+    Args:
+        attacker_type_ids: Attacking Pokemon's type indices.
+        defender_type_ids: Defending Pokemon's type indices.
+
+    Returns:
+        Combined type effectiveness multiplier.
+    """
+    multiplier = 1.0
+
+    for atk_id in attacker_type_ids:
+        atk_row = TYPE_MATRIX[atk_id]
+        for def_id in defender_type_ids:
+            multiplier *= atk_row[def_id]
+
+    return multiplier
+
+
 def get_type_effectiveness(attacker_types: list[str], defender_types: list[str]) -> float:
     """
     Calculate type effectiveness multiplier.
@@ -184,18 +265,23 @@ def get_type_effectiveness(attacker_types: list[str], defender_types: list[str])
     Returns:
         Combined type effectiveness multiplier.
     """
+    # The product doesn't depend on order, so sorting lets permutations share a cache entry
+    return _type_effectiveness(tuple(sorted(attacker_types)), tuple(sorted(defender_types)))
+
+
+@lru_cache(maxsize=1024)
+def _type_effectiveness(attacker_types: tuple[str, ...], defender_types: tuple[str, ...]) -> float:
+    """Memoized body of get_type_effectiveness; real type combinations are few."""
     multiplier = 1.0
 
     for atk_type in attacker_types:
-        atk_chart = TYPE_CHART.get(atk_type, {})
         for def_type in defender_types:
-            type_mult = atk_chart.get(def_type, 1.0)
-            multiplier *= type_mult
+            multiplier *= TYPE_PAIR_CHART.get((atk_type, def_type), 1.0)
 
     return multiplier
 
 
-def calculate_base_power(pokemon: Pokemon) -> float:
+def calculate_base_power(pokemon: PokemonStats) -> float:
     """
     Calculate the base power score for a Pokemon.
 
@@ -213,33 +299,52 @@ def calculate_base_power(pokemon: Pokemon) -> float:
     return power
 
 
+def _combine_score(
+    base_power: float,
+    type_effectiveness: float,
+    attacker_speed: int,
+    defender_speed: int,
+) -> float:
+    """Weigh base power, type effectiveness and speed into an attack score."""
+    # Type effectiveness (30% weight)
+    type_bonus = type_effectiveness * base_power * 0.3
+
+    # Speed advantage (20% weight)
+    speed_ratio = attacker_speed / max(defender_speed, 1)
+    speed_bonus = min(speed_ratio, 2.0) * base_power * 0.2
+
+    # Base power (50% weight)
+    return (base_power * 0.5) + type_bonus + speed_bonus
+
+
 def calculate_battle_score(
-    attacker: Pokemon,
-    defender: Pokemon,
-    attacker_types: list[str],
-    defender_types: list[str],
+    attacker: PokemonStats,
+    defender: PokemonStats,
+    *,
+    build_log: bool = True,
 ) -> tuple[float, list[str]]:
     """
     Calculate the battle score for an attacking Pokemon.
 
     Args:
-        attacker: The attacking Pokemon.
-        defender: The defending Pokemon.
-        attacker_types: Attacker's types.
-        defender_types: Defender's types.
+        attacker: The attacking Pokemon, or its snapshot from get_battle_stats.
+        defender: The defending Pokemon, or its snapshot from get_battle_stats.
+        build_log: Whether to render log entries; skip it when only the score is needed.
 
     Returns:
-        Tuple of (score, log_entries).
+        Tuple of (score, log_entries). log_entries is empty if build_log is False.
     """
-    log_entries: list[str] = []
+    base_power = attacker.base_power
+    if base_power is None:
+        base_power = calculate_base_power(attacker)
 
-    # Base power (50% weight)
-    base_power = calculate_base_power(attacker)
-    log_entries.append(f"  Base Power: {base_power:.2f}")
+    type_effectiveness = get_type_effectiveness_by_ids(attacker.type_ids, defender.type_ids)
+    score = _combine_score(base_power, type_effectiveness, attacker.speed, defender.speed)
 
-    # Type effectiveness (30% weight)
-    type_effectiveness = get_type_effectiveness(attacker_types, defender_types)
-    type_bonus = type_effectiveness * base_power * 0.3
+    if not build_log:
+        return score, []
+
+    log_entries: list[str] = [f"  Base Power: {base_power:.2f}"]
 
     if type_effectiveness > 1:
         log_entries.append(f"  Type Advantage: {type_effectiveness:.2f}x (Super Effective!)")
@@ -248,33 +353,76 @@ def calculate_battle_score(
     else:
         log_entries.append("  Type: Neutral")
 
-    # Speed advantage (20% weight)
-    speed_ratio = attacker.speed / max(defender.speed, 1)
-    speed_bonus = min(speed_ratio, 2.0) * base_power * 0.2
-
     if attacker.speed > defender.speed:
         log_entries.append(f"  Speed Advantage: {attacker.speed} vs {defender.speed}")
     else:
         log_entries.append(f"  Speed: {attacker.speed} vs {defender.speed}")
 
-    # Final score
-    score = (base_power * 0.5) + type_bonus + speed_bonus
     log_entries.append(f"  Final Score: {score:.2f}")
 
     return score, log_entries
 
 
-def execute_battle(pokemon1: Pokemon, pokemon2: Pokemon) -> BattleResult:
+def score_pairs(
+    attackers: Sequence[PokemonStats],
+    defenders: Sequence[PokemonStats],
+) -> list[float]:
     """
-    Execute a battle between two Pokemon.
+    Score many attackers against their defenders in a single pass.
+
+    This is the bulk form of calculate_battle_score for rankings and
+    tournaments: no stat snapshots or log entries are built per pair.
 
     Args:
-        pokemon1: The first Pokemon.
-        pokemon2: The second Pokemon.
+        attackers: The attacking Pokemon.
+        defenders: The defending Pokemon, paired with attackers by position.
 
     Returns:
-        BattleResult with winner, scores, and battle log.
+        Score of each attacker against its defender.
+
+    Raises:
+        ValueError: If attackers and defenders differ in length.
+    """
+    scores: list[float] = []
+    append = scores.append
+
+    for attacker, defender in zip(attackers, defenders, strict=True):
+        base_power = attacker.base_power
+        if base_power is None:
+            base_power = calculate_base_power(attacker)
+
+        type_effectiveness = get_type_effectiveness_by_ids(attacker.type_ids, defender.type_ids)
+        append(_combine_score(base_power, type_effectiveness, attacker.speed, defender.speed))
+
+    return scores
+
+
+@lru_cache(maxsize=4096)
+def _resolve_battle(
+    pokemon1: BattleStats,
+    pokemon2: BattleStats,
+    build_log: bool,
+) -> tuple[float, float, bool, str]:
     """
+    Score a battle between two stat snapshots.
+
+    The outcome depends only on the arguments, so results are memoized.
+
+    Returns:
+        Tuple of (score1, score2, is_draw, battle_log).
+    """
+    # Calculate scores
+    score1, log1 = calculate_battle_score(pokemon1, pokemon2, build_log=build_log)
+    score2, log2 = calculate_battle_score(pokemon2, pokemon1, build_log=build_log)
+
+    # Check for draw (within 1% difference)
+    score_diff = abs(score1 - score2)
+    avg_score = (score1 + score2) / 2
+    is_draw = score_diff < (avg_score * 0.01) if avg_score > 0 else score1 == score2
+
+    if not build_log:
+        return score1, score2, is_draw, ""
+
     log_lines: list[str] = [
         "=" * 50,
         f"BATTLE: {pokemon1.name.upper()} vs {pokemon2.name.upper()}",
@@ -282,15 +430,11 @@ def execute_battle(pokemon1: Pokemon, pokemon2: Pokemon) -> BattleResult:
         "",
     ]
 
-    # Parse types
-    p1_types = [t.strip() for t in pokemon1.types.split(",") if t.strip()]
-    p2_types = [t.strip() for t in pokemon2.types.split(",") if t.strip()]
-
     # Pokemon 1 stats
     p1_sp = f"  SP.ATK: {pokemon1.special_attack} | SP.DEF: {pokemon1.special_defense}"
     log_lines.extend(
         [
-            f"{pokemon1.name.upper()} ({', '.join(p1_types)})",
+            f"{pokemon1.name.upper()} ({pokemon1.types.replace(',', ', ')})",
             f"  HP: {pokemon1.hp} | ATK: {pokemon1.attack} | DEF: {pokemon1.defense}",
             f"{p1_sp} | SPD: {pokemon1.speed}",
             "",
@@ -301,52 +445,75 @@ def execute_battle(pokemon1: Pokemon, pokemon2: Pokemon) -> BattleResult:
     p2_sp = f"  SP.ATK: {pokemon2.special_attack} | SP.DEF: {pokemon2.special_defense}"
     log_lines.extend(
         [
-            f"{pokemon2.name.upper()} ({', '.join(p2_types)})",
+            f"{pokemon2.name.upper()} ({pokemon2.types.replace(',', ', ')})",
             f"  HP: {pokemon2.hp} | ATK: {pokemon2.attack} | DEF: {pokemon2.defense}",
             f"{p2_sp} | SPD: {pokemon2.speed}",
             "",
         ]
     )
 
-    # Calculate scores
+    # Attacks
     log_lines.append(f"--- {pokemon1.name.upper()}'s Attack ---")
-    score1, log1 = calculate_battle_score(pokemon1, pokemon2, p1_types, p2_types)
     log_lines.extend(log1)
     log_lines.append("")
 
     log_lines.append(f"--- {pokemon2.name.upper()}'s Attack ---")
-    score2, log2 = calculate_battle_score(pokemon2, pokemon1, p2_types, p1_types)
     log_lines.extend(log2)
     log_lines.append("")
 
     # Determine winner
     log_lines.append("=" * 50)
 
-    # Check for draw (within 1% difference)
-    score_diff = abs(score1 - score2)
-    avg_score = (score1 + score2) / 2
-    is_draw = score_diff < (avg_score * 0.01) if avg_score > 0 else score1 == score2
-
     if is_draw:
-        winner = None
         log_lines.append("RESULT: DRAW!")
         log_lines.append(f"Scores were too close: {score1:.2f} vs {score2:.2f}")
     elif score1 > score2:
-        winner = pokemon1
         log_lines.append(f"WINNER: {pokemon1.name.upper()}!")
         log_lines.append(f"Final Scores: {score1:.2f} vs {score2:.2f}")
     else:
-        winner = pokemon2
         log_lines.append(f"WINNER: {pokemon2.name.upper()}!")
         log_lines.append(f"Final Scores: {score1:.2f} vs {score2:.2f}")
 
     log_lines.append("=" * 50)
 
+    return score1, score2, is_draw, "\n".join(log_lines)
+
+
+def execute_battle(
+    pokemon1: Pokemon,
+    pokemon2: Pokemon,
+    *,
+    build_log: bool = True,
+) -> BattleResult:
+    """
+    Execute a battle between two Pokemon.
+
+    Args:
+        pokemon1: The first Pokemon.
+        pokemon2: The second Pokemon.
+        build_log: Whether to render the battle log. When False, battle_log is
+            empty and only the scores and winner are computed.
+
+    Returns:
+        BattleResult with winner, scores, and battle log.
+    """
+    score1, score2, is_draw, battle_log = _resolve_battle(
+        get_battle_stats(pokemon1), get_battle_stats(pokemon2), build_log
+    )
+
+    winner: Pokemon | None
+    if is_draw:
+        winner = None
+    elif score1 > score2:
+        winner = pokemon1
+    else:
+        winner = pokemon2
+
     return BattleResult(
         winner=winner,
         pokemon1_score=round(score1, 2),
         pokemon2_score=round(score2, 2),
-        battle_log="\n".join(log_lines),
+        battle_log=battle_log,
         is_draw=is_draw,
     )
 
@@ -360,9 +527,15 @@ class DefaultBattleEngine:
     - Speed advantage (20% weight)
     """
 
-    def execute(self, pokemon1: Pokemon, pokemon2: Pokemon) -> BattleResult:
+    def execute(
+        self,
+        pokemon1: Pokemon,
+        pokemon2: Pokemon,
+        *,
+        build_log: bool = True,
+    ) -> BattleResult:
         """Execute a battle between two Pokemon."""
-        return execute_battle(pokemon1, pokemon2)
+        return execute_battle(pokemon1, pokemon2, build_log=build_log)
 
 
 def get_battle_engine() -> DefaultBattleEngine:
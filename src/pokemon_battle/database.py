@@ -4,13 +4,14 @@ from collections.abc import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from pokemon_battle.config import get_settings
-
-settings = get_settings()
+from pokemon_battle.config import settings
 
 engine = create_async_engine(
     settings.database.url,
     echo=settings.api.debug,
+    pool_size=settings.database.pool_size,
+    max_overflow=settings.database.max_overflow,
+    pool_recycle=settings.database.pool_recycle,
     pool_pre_ping=True,
 )
 
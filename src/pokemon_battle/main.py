@@ -3,16 +3,16 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from pokemon_battle import __version__
 from pokemon_battle.api import router
-from pokemon_battle.config import get_settings
+from pokemon_battle.config import settings
 from pokemon_battle.database import close_db, init_db
 from pokemon_battle.exceptions import PokemonBattleError
-
-settings = get_settings()
+from pokemon_battle.pokeapi import get_pokeapi_client
 
 
 @asynccontextmanager
@@ -22,6 +22,7 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     await init_db()
     yield
     # Shutdown
+    await get_pokeapi_client().aclose()
     await close_db()
 
 
@@ -33,6 +34,7 @@ app = FastAPI(
         "and determines battle outcomes based on stats and type effectiveness."
     ),
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -42,9 +44,9 @@ app = FastAPI(
 async def pokemon_battle_error_handler(
     request: Request,  # noqa: ARG001
     exc: PokemonBattleError,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Global exception handler for PokemonBattleError."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": exc.message, "error_code": exc.error_code},
     )
@@ -54,15 +56,19 @@ async def pokemon_battle_error_handler(
 app.include_router(router, prefix="/api/v1")
 
 
-# Root endpoint
-@app.get("/", tags=["Root"])
-async def root() -> dict[str, str]:
+# Root endpoint; name, version and docs path are fixed at startup, so the body is prebuilt
+_ROOT_BODY = orjson.dumps({"name": settings.api.title, "version": __version__, "docs": "/docs"})
+
+
+@app.get(
+    "/",
+    tags=["Root"],
+    response_model=None,
+    responses={200: {"model": dict[str, str], "description": "Successful Response"}},
+)
+async def root() -> Response:
     """Root endpoint with API information."""
-    return {
-        "name": settings.api.title,
-        "version": __version__,
-        "docs": "/docs",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 def create_app() -> FastAPI:
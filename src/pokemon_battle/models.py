@@ -1,10 +1,58 @@
 """SQLAlchemy models for Pokemon and Battle data."""
 
+from collections.abc import Iterable
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, func
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy import (
+    Computed,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, validates
+
+# Canonical Pokemon type order; types are stored as indices into this tuple
+POKEMON_TYPES: tuple[str, ...] = (
+    "normal",
+    "fire",
+    "water",
+    "electric",
+    "grass",
+    "ice",
+    "fighting",
+    "poison",
+    "ground",
+    "flying",
+    "psychic",
+    "bug",
+    "rock",
+    "ghost",
+    "dragon",
+    "dark",
+    "steel",
+    "fairy",
+)
+
+TYPE_INDEX: dict[str, int] = {type_name: index for index, type_name in enumerate(POKEMON_TYPES)}
+
+
+def get_type_ids(types: Iterable[str]) -> tuple[int, ...]:
+    """
+    Convert type names into TYPE_INDEX ids.
+
+    Args:
+        types: Type names, e.g. ["fire", "flying"].
+
+    Returns:
+        Tuple of type indices. Unknown types are skipped, so they count as neutral.
+    """
+    return tuple(TYPE_INDEX[t] for t in (t.strip() for t in types) if t in TYPE_INDEX)
 
 
 class Base(DeclarativeBase):
@@ -17,6 +65,8 @@ class Pokemon(Base):
     """Pokemon entity stored in the database."""
 
     __tablename__ = "pokemon"
+    # Fetch server-generated columns in the INSERT/UPDATE itself instead of expiring them
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     pokeapi_id: Mapped[int] = mapped_column(Integer, unique=True, index=True)
@@ -30,8 +80,20 @@ class Pokemon(Base):
     special_defense: Mapped[int] = mapped_column(Integer)
     speed: Mapped[int] = mapped_column(Integer)
 
-    # Types (comma-separated for simplicity)
+    # Battle power derived from the base stats (see battle.calculate_base_power)
+    base_power: Mapped[float] = mapped_column(
+        Float,
+        Computed(
+            "(hp * 0.5 + (attack + special_attack) / 2.0"
+            " + (defense + special_defense) / 2.0 + speed) / 4.0",
+            persisted=True,
+        ),
+    )
+
+    # Types (comma-separated for display, indexed ids for battle lookups)
     types: Mapped[str] = mapped_column(String(100))
+    type1_id: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
+    type2_id: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
 
     # Sprite URL for display
     sprite_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
@@ -46,6 +108,21 @@ class Pokemon(Base):
         battles_as_pokemon2: Mapped[list[Battle]]
         battles_won: Mapped[list[Battle]]
 
+    @validates("types")
+    def _sync_type_ids(self, _key: str, value: str) -> str:
+        """Keep the type id columns in step with the comma-separated types."""
+        # Pad so Pokemon with fewer than two known types get NULL ids
+        self.type1_id, self.type2_id = (*get_type_ids(value.split(",")), None, None)[:2]
+        return value
+
+    @property
+    def type_ids(self) -> tuple[int, ...]:
+        """Type indices into POKEMON_TYPES, primary type first."""
+        # Rows from before the id columns existed have them NULL until backfilled
+        if self.type1_id is None and self.type2_id is None and self.types:
+            return get_type_ids(self.types.split(","))
+        return tuple(t for t in (self.type1_id, self.type2_id) if t is not None)
+
     def __repr__(self) -> str:
         return f"<Pokemon(id={self.id}, name={self.name})>"
 
@@ -54,10 +131,16 @@ class Battle(Base):
     """Battle record between two Pokemon."""
 
     __tablename__ = "battles"
+    __table_args__ = (
+        # Covers lookups by matchup as well as by pokemon1_id alone
+        Index("ix_battles_pair", "pokemon1_id", "pokemon2_id"),
+        Index("ix_battles_winner", "winner_id"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
-    pokemon1_id: Mapped[int] = mapped_column(ForeignKey("pokemon.id"), index=True)
+    pokemon1_id: Mapped[int] = mapped_column(ForeignKey("pokemon.id"))
     pokemon2_id: Mapped[int] = mapped_column(ForeignKey("pokemon.id"), index=True)
     winner_id: Mapped[int | None] = mapped_column(ForeignKey("pokemon.id"), nullable=True)
 
@@ -66,7 +149,10 @@ class Battle(Base):
     pokemon2_score: Mapped[float] = mapped_column(Float)
     battle_log: Mapped[str] = mapped_column(Text)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Indexed for the newest-first battle listing
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
 
     # Relationships
     pokemon1: Mapped[Pokemon] = relationship(
@@ -1,53 +1,128 @@
 """PokeAPI client with caching support."""
 
+import asyncio
 import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
+import orjson
 
-from pokemon_battle.config import get_settings
+from pokemon_battle.config import settings
 from pokemon_battle.exceptions import PokeAPIError, PokemonNotFoundError
 from pokemon_battle.schemas import PokemonCreate
 
-settings = get_settings()
+# Position of each stat in PokemonCreate's stat fields
+_STAT_IDX = {
+    "hp": 0,
+    "attack": 1,
+    "defense": 2,
+    "special-attack": 3,
+    "special-defense": 4,
+    "speed": 5,
+}
 
+# Lookups per cache slot after which access counts are halved, so old popularity fades
+_FREQUENCY_WINDOW = 10
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class CacheEntry:
-    """A cached entry with expiration time."""
+    """A cached entry with expiration time; data is None for a known-missing Pokemon."""
 
-    data: dict[str, Any]
+    data: PokemonCreate | None
     expires_at: float
 
 
 @dataclass
 class PokemonCache:
-    """Simple in-memory cache for Pokemon data."""
+    """
+    Bounded in-memory LRU cache for parsed Pokemon data with per-entry TTL.
 
-    _cache: dict[str, CacheEntry] = field(default_factory=dict)
+    When full, a new key is only admitted if it has been looked up at least as
+    often as the least recently used entry it would evict, so a burst of
+    one-off lookups can't push out popular Pokemon.
+    """
+
+    # Ordered from least to most recently used
+    _cache: OrderedDict[str, CacheEntry] = field(default_factory=OrderedDict)
     ttl: int = field(default_factory=lambda: settings.cache.pokemon_ttl)
+    max_size: int = field(default_factory=lambda: settings.cache.pokemon_max_size)
+    negative_ttl: int = field(default_factory=lambda: settings.cache.negative_ttl)
+    # Clock for expiry times; monotonic so wall-clock adjustments can't revive entries
+    time_func: Callable[[], float] = time.monotonic
+    # Recent lookup counts per key, including misses
+    _frequency: Counter[str] = field(default_factory=Counter)
+    _lookups: int = 0
+
+    def get(self, key: str) -> PokemonCreate | None:
+        """
+        Get a value from cache if not expired, marking it recently used.
 
-    def get(self, key: str) -> dict[str, Any] | None:
-        """Get a value from cache if not expired."""
+        Raises:
+            PokemonNotFoundError: If the key was recently cached as not found.
+        """
+        self._record_lookup(key)
         entry = self._cache.get(key)
         if entry is None:
             return None
-        if time.time() > entry.expires_at:
+        if self.time_func() > entry.expires_at:
             del self._cache[key]
             return None
+        self._cache.move_to_end(key)
+        if entry.data is None:
+            raise PokemonNotFoundError(key)
         return entry.data
 
-    def set(self, key: str, value: dict[str, Any]) -> None:
-        """Set a value in cache with TTL."""
+    def set(self, key: str, value: PokemonCreate) -> None:
+        """Set a value in cache with TTL, evicting the least recently used when full."""
+        self._store(key, value, self.ttl)
+
+    def set_negative(self, key: str) -> None:
+        """Remember that a Pokemon doesn't exist, for the shorter negative TTL."""
+        self._store(key, None, self.negative_ttl)
+
+    def _store(self, key: str, value: PokemonCreate | None, ttl: int) -> None:
+        """Store an entry, evicting the least recently used when full."""
+        now = self.time_func()
+
+        # Drop expired entries from the cold end so they don't hold slots
+        while self._cache:
+            oldest = next(iter(self._cache.values()))
+            if now <= oldest.expires_at:
+                break
+            self._cache.popitem(last=False)
+
+        # When full, a new key has to be at least as popular as the LRU victim
+        if key not in self._cache and len(self._cache) >= self.max_size:
+            victim = next(iter(self._cache), None)
+            if victim is None or self._frequency[key] < self._frequency[victim]:
+                return
+            del self._cache[victim]
+
         self._cache[key] = CacheEntry(
             data=value,
-            expires_at=time.time() + self.ttl,
+            expires_at=now + ttl,
         )
+        self._cache.move_to_end(key)
 
     def clear(self) -> None:
         """Clear all cached entries."""
         self._cache.clear()
+        self._frequency.clear()
+        self._lookups = 0
+
+    def _record_lookup(self, key: str) -> None:
+        """Count a lookup of key, halving all counts once per window."""
+        self._frequency[key] += 1
+        self._lookups += 1
+        if self._lookups >= self.max_size * _FREQUENCY_WINDOW:
+            self._frequency = Counter(
+                {k: count // 2 for k, count in self._frequency.items() if count > 1}
+            )
+            self._lookups = 0
 
 
 # Global cache instance
@@ -59,6 +134,34 @@ def get_cache() -> PokemonCache:
     return _pokemon_cache
 
 
+def _parse_pokemon_data(data: dict[str, Any]) -> PokemonCreate:
+    """Parse raw PokeAPI response into PokemonCreate schema."""
+    # One pass with a single probe per stat; missing stats stay 0, unknown ones are ignored
+    values = [0] * len(_STAT_IDX)
+    for stat in data["stats"]:
+        index = _STAT_IDX.get(stat["stat"]["name"])
+        if index is not None:
+            values[index] = stat["base_stat"]
+    hp, attack, defense, special_attack, special_defense, speed = values
+
+    sprite_url = None
+    if sprites := data.get("sprites"):
+        sprite_url = sprites.get("front_default")
+
+    return PokemonCreate(
+        pokeapi_id=data["id"],
+        name=data["name"],
+        hp=hp,
+        attack=attack,
+        defense=defense,
+        special_attack=special_attack,
+        special_defense=special_defense,
+        speed=speed,
+        types=",".join(t["type"]["name"] for t in data["types"]),
+        sprite_url=sprite_url,
+    )
+
+
 class PokeAPIClient:
     """Client for interacting with the PokeAPI."""
 
@@ -66,13 +169,37 @@ class PokeAPIClient:
         self.base_url = settings.pokeapi.base_url
         self.timeout = settings.pokeapi.timeout
         self.cache = cache or get_cache()
+        # One pooled client for all requests, opened on first use
+        self._client: httpx.AsyncClient | None = None
+        # Fetches currently in progress, so concurrent callers share one request
+        self._inflight: dict[str, asyncio.Task[PokemonCreate]] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, opening it if needed."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                http2=settings.pokeapi.http2,
+                limits=httpx.Limits(
+                    max_connections=settings.pokeapi.max_connections,
+                    max_keepalive_connections=settings.pokeapi.max_keepalive_connections,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool; the next fetch reopens it."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def get_pokemon(self, name: str) -> PokemonCreate:
         """
         Fetch Pokemon data from PokeAPI.
 
         Args:
-            name: The name of the Pokemon to fetch.
+            name: The normalized name of the Pokemon to fetch (see normalize_name).
 
         Returns:
             PokemonCreate schema with Pokemon data.
@@ -81,59 +208,61 @@ class PokeAPIClient:
             PokemonNotFoundError: If the Pokemon is not found.
             PokeAPIError: If there's an error communicating with PokeAPI.
         """
-        name_lower = name.lower().strip()
-
-        # Check cache first
-        cached_data = self.cache.get(name_lower)
-        if cached_data is not None:
-            return self._parse_pokemon_data(cached_data)
-
-        # Fetch from API
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.get(f"{self.base_url}/pokemon/{name_lower}")
-
-                if response.status_code == 404:
-                    raise PokemonNotFoundError(name)
-
-                response.raise_for_status()
-                data = response.json()
-
-                # Cache the response
-                self.cache.set(name_lower, data)
-
-                return self._parse_pokemon_data(data)
-
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    raise PokemonNotFoundError(name) from e
-                raise PokeAPIError(f"HTTP error {e.response.status_code}") from e
-            except httpx.RequestError as e:
-                raise PokeAPIError(str(e)) from e
-
-    def _parse_pokemon_data(self, data: dict[str, Any]) -> PokemonCreate:
-        """Parse raw PokeAPI response into PokemonCreate schema."""
-        stats = {stat["stat"]["name"]: stat["base_stat"] for stat in data["stats"]}
-        types = [t["type"]["name"] for t in data["types"]]
-
-        sprite_url = None
-        if sprites := data.get("sprites"):
-            sprite_url = sprites.get("front_default")
-
-        return PokemonCreate(
-            pokeapi_id=data["id"],
-            name=data["name"],
-            hp=stats.get("hp", 0),
-            attack=stats.get("attack", 0),
-            defense=stats.get("defense", 0),
-            special_attack=stats.get("special-attack", 0),
-            special_defense=stats.get("special-defense", 0),
-            speed=stats.get("speed", 0),
-            types=",".join(types),
-            sprite_url=sprite_url,
-        )
+        # Check cache first; entries are already parsed
+        cached = self.cache.get(name)
+        if cached is not None:
+            return cached
+
+        # Join a fetch already in progress for this name, or start one. The fetch
+        # runs as its own task so cancelling any caller, the first included,
+        # doesn't cancel it for the others.
+        task = self._inflight.get(name)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_pokemon(name))
+            self._inflight[name] = task
+            task.add_done_callback(lambda done: self._finish_fetch(name, done))
+        return await asyncio.shield(task)
+
+    def _finish_fetch(self, name: str, task: asyncio.Task[PokemonCreate]) -> None:
+        """Forget a finished fetch so the next miss for name starts a new one."""
+        if self._inflight.get(name) is task:
+            del self._inflight[name]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch_pokemon(self, name: str) -> PokemonCreate:
+        """Fetch a Pokemon from PokeAPI and cache the response."""
+        try:
+            response = await self._get_client().get(f"/pokemon/{name}")
+
+            if response.status_code == 404:
+                self.cache.set_negative(name)
+                raise PokemonNotFoundError(name)
+
+            response.raise_for_status()
+            pokemon = _parse_pokemon_data(orjson.loads(response.content))
+
+            # Cache the parsed result
+            self.cache.set(name, pokemon)
+
+            return pokemon
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                self.cache.set_negative(name)
+                raise PokemonNotFoundError(name) from e
+            raise PokeAPIError(f"HTTP error {e.response.status_code}") from e
+        except httpx.RequestError as e:
+            raise PokeAPIError(str(e)) from e
+        except orjson.JSONDecodeError as e:
+            raise PokeAPIError(f"Invalid JSON response: {e}") from e
+
+
+# Global client instance, closed on application shutdown
+_pokeapi_client = PokeAPIClient()
 
 
 def get_pokeapi_client() -> PokeAPIClient:
-    """Get a PokeAPI client instance."""
-    return PokeAPIClient()
+    """Get the global PokeAPI client instance."""
+    return _pokeapi_client
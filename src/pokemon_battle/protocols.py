@@ -6,6 +6,63 @@ from pokemon_battle.models import Pokemon
 from pokemon_battle.schemas import PokemonCreate
 
 
+class PokemonStats(Protocol):
+    """Protocol for the Pokemon attributes the battle algorithm reads.
+
+    Satisfied by the Pokemon model and by immutable stat snapshots.
+    """
+
+    @property
+    def name(self) -> str:
+        """Pokemon name."""
+        ...
+
+    @property
+    def types(self) -> str:
+        """Comma-separated type names."""
+        ...
+
+    @property
+    def type_ids(self) -> tuple[int, ...]:
+        """Type indices into POKEMON_TYPES."""
+        ...
+
+    @property
+    def hp(self) -> int:
+        """Hit points."""
+        ...
+
+    @property
+    def attack(self) -> int:
+        """Attack stat."""
+        ...
+
+    @property
+    def defense(self) -> int:
+        """Defense stat."""
+        ...
+
+    @property
+    def special_attack(self) -> int:
+        """Special attack stat."""
+        ...
+
+    @property
+    def special_defense(self) -> int:
+        """Special defense stat."""
+        ...
+
+    @property
+    def speed(self) -> int:
+        """Speed stat."""
+        ...
+
+    @property
+    def base_power(self) -> float | None:
+        """Stored base power, or None if it hasn't been computed yet."""
+        ...
+
+
 class BattleResult(Protocol):
     """Protocol for battle result data."""
 
@@ -71,13 +128,20 @@ class BattleEngine(Protocol):
     - Custom scoring systems
     """
 
-    def execute(self, pokemon1: Pokemon, pokemon2: Pokemon) -> BattleResult:
+    def execute(
+        self,
+        pokemon1: Pokemon,
+        pokemon2: Pokemon,
+        *,
+        build_log: bool = True,
+    ) -> BattleResult:
         """
         Execute a battle between two Pokemon.
 
         Args:
             pokemon1: The first Pokemon.
             pokemon2: The second Pokemon.
+            build_log: Whether to render the battle log.
 
         Returns:
             BattleResult with winner, scores, and battle log.
@@ -1,8 +1,38 @@
 """Pydantic schemas for API request/response models."""
 
+import re
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+
+# PokeAPI names are lowercase ASCII words joined by hyphens, e.g. "mr-mime"
+_NAME_RE = re.compile(r"[a-z0-9-]{1,100}")
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a Pokemon name to its canonical lowercase form.
+
+    Names are normalized once at the API boundary; services, caches and the
+    PokeAPI client expect the canonical form.
+
+    Args:
+        name: The Pokemon name as given by the caller.
+
+    Returns:
+        The stripped, lowercased name.
+
+    Raises:
+        ValueError: If the name contains characters PokeAPI names never use.
+    """
+    normalized = name.strip().lower()
+    if _NAME_RE.fullmatch(normalized) is None:
+        raise ValueError(f"Invalid Pokemon name {name!r}")
+    return normalized
+
+
+PokemonName = Annotated[str, AfterValidator(normalize_name)]
 
 
 class PokemonBase(BaseModel):
@@ -56,8 +86,8 @@ class PokemonResponse(BaseModel):
 class BattleRequest(BaseModel):
     """Request schema for starting a battle."""
 
-    pokemon1_name: str = Field(..., min_length=1, description="Name of the first Pokemon")
-    pokemon2_name: str = Field(..., min_length=1, description="Name of the second Pokemon")
+    pokemon1_name: PokemonName = Field(..., description="Name of the first Pokemon")
+    pokemon2_name: PokemonName = Field(..., description="Name of the second Pokemon")
 
 
 class BattleResponse(BaseModel):
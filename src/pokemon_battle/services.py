@@ -1,14 +1,34 @@
 """Business logic services for Pokemon battles."""
 
-from sqlalchemy import select
+import asyncio
+import time
+
+from sqlalchemy import insert, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, make_transient_to_detached, selectinload
 
+from pokemon_battle.config import settings
 from pokemon_battle.exceptions import SamePokemonError
-from pokemon_battle.models import Battle, Pokemon
-from pokemon_battle.protocols import BattleEngine, PokemonProvider
+from pokemon_battle.models import Battle, Pokemon, get_type_ids
+from pokemon_battle.protocols import BattleEngine, BattleResult, PokemonProvider
 from pokemon_battle.schemas import PokemonCreate
 
+# Process-wide cache of stored Pokemon by name, as detached copies with a monotonic expiry time
+_NAME_CACHE: dict[str, tuple[float, Pokemon]] = {}
+
+
+def clear_name_cache() -> None:
+    """Clear the process-wide Pokemon name cache."""
+    _NAME_CACHE.clear()
+
+
+def _detached_copy(pokemon: Pokemon) -> Pokemon:
+    """Copy a stored Pokemon into a detached instance that no session owns."""
+    values = {attr.key: getattr(pokemon, attr.key) for attr in inspect(Pokemon).column_attrs}
+    copy = Pokemon(**values)
+    make_transient_to_detached(copy)
+    return copy
+
 
 class PokemonService:
     """Service for Pokemon-related operations."""
@@ -22,7 +42,7 @@ class PokemonService:
         Get a Pokemon from database or fetch from PokeAPI.
 
         Args:
-            name: The name of the Pokemon.
+            name: The normalized name of the Pokemon (see normalize_name).
 
         Returns:
             Pokemon model instance.
@@ -31,46 +51,119 @@ class PokemonService:
             PokemonNotFoundError: If the Pokemon doesn't exist.
             PokeAPIError: If there's an error fetching from PokeAPI.
         """
-        name_lower = name.lower().strip()
+        pokemon = await self.get_or_fetch_many([name])
+        return pokemon[name]
 
-        # Check database first
-        stmt = select(Pokemon).where(Pokemon.name == name_lower)
-        result = await self.db.execute(stmt)
-        pokemon = result.scalar_one_or_none()
-
-        if pokemon is not None:
-            return pokemon
-
-        # Fetch from provider
-        pokemon_data = await self.pokemon_provider.get_pokemon(name_lower)
-
-        # Create and save to database
-        pokemon = await self._create_pokemon(pokemon_data)
-        return pokemon
-
-    async def _create_pokemon(self, data: PokemonCreate) -> Pokemon:
-        """Create a new Pokemon in the database."""
-        pokemon = Pokemon(
-            pokeapi_id=data.pokeapi_id,
-            name=data.name,
-            hp=data.hp,
-            attack=data.attack,
-            defense=data.defense,
-            special_attack=data.special_attack,
-            special_defense=data.special_defense,
-            speed=data.speed,
-            types=data.types,
-            sprite_url=data.sprite_url,
-        )
-        self.db.add(pokemon)
-        await self.db.flush()
-        return pokemon
+    async def get_or_fetch_many(self, names: list[str]) -> dict[str, Pokemon]:
+        """
+        Get several Pokemon from the database in one query, fetching any misses.
+
+        Pokemon missing from the database are fetched from the provider
+        concurrently and inserted together (see create_many). Names that
+        resolve to the same Pokemon, such as a PokeAPI id and its name, map
+        to a single row.
+
+        Args:
+            names: The normalized names of the Pokemon (see normalize_name).
+
+        Returns:
+            Mapping of name to Pokemon model instance.
+
+        Raises:
+            PokemonNotFoundError: If a Pokemon doesn't exist.
+            PokeAPIError: If there's an error fetching from PokeAPI.
+        """
+        names = list(dict.fromkeys(names))
+
+        # Check name cache, then database for the rest in one query
+        pokemon_by_name: dict[str, Pokemon] = {}
+        for name in names:
+            cached = await self._get_cached(name)
+            if cached is not None:
+                pokemon_by_name[name] = cached
+
+        uncached = [name for name in names if name not in pokemon_by_name]
+        if uncached:
+            stmt = select(Pokemon).where(Pokemon.name.in_(uncached))
+            result = await self.db.execute(stmt)
+            for pokemon in result.scalars():
+                self._cache_pokemon(pokemon)
+                pokemon_by_name[pokemon.name] = pokemon
+
+        missing = [name for name in names if name not in pokemon_by_name]
+        if not missing:
+            return pokemon_by_name
+
+        # Fetch all misses from provider concurrently
+        fetched = await asyncio.gather(*(self.pokemon_provider.get_pokemon(n) for n in missing))
+
+        # Aliases such as "25" and "pikachu" fetch the same Pokemon, so key by PokeAPI id
+        by_pokeapi_id = {pokemon.pokeapi_id: pokemon for pokemon in pokemon_by_name.values()}
+        new = {data.pokeapi_id: data for data in fetched if data.pokeapi_id not in by_pokeapi_id}
+
+        # An alias's canonical name may already be stored without having been looked up
+        looked_up = set(uncached)
+        recheck = [data.name for data in new.values() if data.name not in looked_up]
+        if recheck:
+            stmt = select(Pokemon).where(Pokemon.name.in_(recheck))
+            result = await self.db.execute(stmt)
+            for pokemon in result.scalars():
+                self._cache_pokemon(pokemon)
+                by_pokeapi_id[pokemon.pokeapi_id] = pokemon
+                new.pop(pokemon.pokeapi_id, None)
+
+        # RETURNING order is not guaranteed, so rows are matched back by PokeAPI id too
+        for pokemon in await self.create_many(list(new.values())):
+            by_pokeapi_id[pokemon.pokeapi_id] = pokemon
+
+        for name, data in zip(missing, fetched, strict=True):
+            pokemon_by_name[name] = by_pokeapi_id[data.pokeapi_id]
+
+        return pokemon_by_name
+
+    async def _get_cached(self, name: str) -> Pokemon | None:
+        """Get a Pokemon from the name cache, merged into this session without a query."""
+        entry = _NAME_CACHE.get(name)
+        if entry is None:
+            return None
+        expires_at, pokemon = entry
+        if time.monotonic() > expires_at:
+            del _NAME_CACHE[name]
+            return None
+        return await self.db.merge(pokemon, load=False)
+
+    def _cache_pokemon(self, pokemon: Pokemon) -> None:
+        """Add a Pokemon loaded from the database to the name cache."""
+        expires_at = time.monotonic() + settings.cache.pokemon_ttl
+        _NAME_CACHE[pokemon.name] = (expires_at, _detached_copy(pokemon))
+
+    async def create_many(self, creates: list[PokemonCreate]) -> list[Pokemon]:
+        """
+        Insert several new Pokemon with a single INSERT ... RETURNING.
+
+        Args:
+            creates: Provider data for Pokemon not yet in the database.
+
+        Returns:
+            The inserted Pokemon. Their order is not guaranteed to match creates.
+        """
+        if not creates:
+            return []
+
+        # Core-style insert skips the types validator, so set the type ids here
+        rows = []
+        for data in creates:
+            type1_id, type2_id = (*get_type_ids(data.types.split(",")), None, None)[:2]
+            rows.append({**data.model_dump(), "type1_id": type1_id, "type2_id": type2_id})
+
+        # Render NULLs so rows with and without optional values share one statement
+        stmt = insert(Pokemon).returning(Pokemon)
+        result = await self.db.scalars(stmt, rows, execution_options={"render_nulls": True})
+        return list(result)
 
     async def get_pokemon_by_id(self, pokemon_id: int) -> Pokemon | None:
-        """Get a Pokemon by its database ID."""
-        stmt = select(Pokemon).where(Pokemon.id == pokemon_id)
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        """Get a Pokemon by its database ID, from the session's identity map if loaded."""
+        return await self.db.get(Pokemon, pokemon_id)
 
     async def list_pokemon(self, limit: int = 100, offset: int = 0) -> list[Pokemon]:
         """List all Pokemon in the database."""
@@ -92,13 +185,32 @@ class BattleService:
         self.pokemon_service = pokemon_service
         self.battle_engine = battle_engine
 
+    async def _get_opponents(
+        self,
+        pokemon1_name: str,
+        pokemon2_name: str,
+    ) -> tuple[Pokemon, Pokemon]:
+        """Validate and load both Pokemon for a battle."""
+        # Check for same Pokemon
+        if pokemon1_name == pokemon2_name:
+            raise SamePokemonError(pokemon1_name)
+
+        # Get or fetch both Pokemon with a single lookup
+        pokemon = await self.pokemon_service.get_or_fetch_many([pokemon1_name, pokemon2_name])
+        pokemon1, pokemon2 = pokemon[pokemon1_name], pokemon[pokemon2_name]
+
+        # Different names can still be the same Pokemon, e.g. "25" and "pikachu"
+        if pokemon1 is pokemon2:
+            raise SamePokemonError(pokemon1.name)
+        return pokemon1, pokemon2
+
     async def execute_battle(self, pokemon1_name: str, pokemon2_name: str) -> Battle:
         """
         Execute a battle between two Pokemon.
 
         Args:
-            pokemon1_name: Name of the first Pokemon.
-            pokemon2_name: Name of the second Pokemon.
+            pokemon1_name: Normalized name of the first Pokemon.
+            pokemon2_name: Normalized name of the second Pokemon.
 
         Returns:
             Battle record with results.
@@ -107,26 +219,17 @@ class BattleService:
             SamePokemonError: If both names refer to the same Pokemon.
             PokemonNotFoundError: If a Pokemon doesn't exist.
         """
-        # Normalize names
-        name1 = pokemon1_name.lower().strip()
-        name2 = pokemon2_name.lower().strip()
-
-        # Check for same Pokemon
-        if name1 == name2:
-            raise SamePokemonError(name1)
-
-        # Get or fetch both Pokemon
-        pokemon1 = await self.pokemon_service.get_or_fetch_pokemon(name1)
-        pokemon2 = await self.pokemon_service.get_or_fetch_pokemon(name2)
+        pokemon1, pokemon2 = await self._get_opponents(pokemon1_name, pokemon2_name)
 
         # Execute battle using the engine
         result = self.battle_engine.execute(pokemon1, pokemon2)
 
-        # Save battle record
+        # Save battle record, with relationships set up front for the response.
+        # Newly fetched Pokemon were already inserted by get_or_fetch_many.
         battle = Battle(
-            pokemon1_id=pokemon1.id,
-            pokemon2_id=pokemon2.id,
-            winner_id=result.winner.id if result.winner else None,
+            pokemon1=pokemon1,
+            pokemon2=pokemon2,
+            winner=result.winner,
             pokemon1_score=result.pokemon1_score,
             pokemon2_score=result.pokemon2_score,
             battle_log=result.battle_log,
@@ -134,29 +237,48 @@ class BattleService:
         self.db.add(battle)
         await self.db.flush()
 
-        # Load relationships for response
-        battle.pokemon1 = pokemon1
-        battle.pokemon2 = pokemon2
-        battle.winner = result.winner
+        # Detach the fully loaded record so reading it can never trigger a refresh
+        self.db.expunge(battle)
 
         return battle
 
+    async def predict_battle(self, pokemon1_name: str, pokemon2_name: str) -> BattleResult:
+        """
+        Work out who would win a battle without recording it.
+
+        The battle log is not rendered, so this is cheaper than execute_battle
+        when only the scores and winner are needed.
+
+        Args:
+            pokemon1_name: Normalized name of the first Pokemon.
+            pokemon2_name: Normalized name of the second Pokemon.
+
+        Returns:
+            Battle result with an empty battle log.
+
+        Raises:
+            SamePokemonError: If both names refer to the same Pokemon.
+            PokemonNotFoundError: If a Pokemon doesn't exist.
+        """
+        pokemon1, pokemon2 = await self._get_opponents(pokemon1_name, pokemon2_name)
+        return self.battle_engine.execute(pokemon1, pokemon2, build_log=False)
+
     async def get_battle(self, battle_id: int) -> Battle | None:
-        """Get a battle by ID with related Pokemon loaded."""
+        """Get a battle by ID with related Pokemon joined into the same query."""
         stmt = (
             select(Battle)
             .where(Battle.id == battle_id)
             .options(
-                selectinload(Battle.pokemon1),
-                selectinload(Battle.pokemon2),
-                selectinload(Battle.winner),
+                joinedload(Battle.pokemon1),
+                joinedload(Battle.pokemon2),
+                joinedload(Battle.winner),
             )
         )
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
     async def list_battles(self, limit: int = 100, offset: int = 0) -> list[Battle]:
-        """List all battles with related Pokemon loaded."""
+        """List all battles with related Pokemon batch-loaded via selectin queries."""
         stmt = (
             select(Battle)
             .order_by(Battle.created_at.desc())
@@ -4,14 +4,19 @@ from collections.abc import AsyncGenerator
 from typing import Any
 
 import pytest
+import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import StaticPool
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import StaticPool, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 from pokemon_battle.database import get_db
+from pokemon_battle.exceptions import PokemonNotFoundError
 from pokemon_battle.main import app
 from pokemon_battle.models import Base, Pokemon
-from pokemon_battle.pokeapi import PokeAPIClient, PokemonCache, get_pokeapi_client
+from pokemon_battle.pokeapi import PokemonCache, _parse_pokemon_data, get_pokeapi_client
+from pokemon_battle.protocols import PokemonProvider
+from pokemon_battle.schemas import PokemonCreate
+from pokemon_battle.services import clear_name_cache
 
 # Test database setup
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -22,26 +27,51 @@ test_engine = create_async_engine(
     poolclass=StaticPool,
 )
 
-TestSessionLocal = async_sessionmaker(
-    test_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
 
+# pysqlite's own transaction handling breaks SAVEPOINT, so let SQLAlchemy emit BEGIN
+@event.listens_for(test_engine.sync_engine, "connect")
+def _disable_pysqlite_begin(dbapi_connection: Any, connection_record: Any) -> None:
+    dbapi_connection.isolation_level = None
 
-@pytest.fixture
-async def db_session() -> AsyncGenerator[AsyncSession]:
-    """Create a test database session."""
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn: Any) -> None:
+    conn.exec_driver_sql("BEGIN")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def db_schema() -> AsyncGenerator[None]:
+    """Create the test database schema once for the whole run."""
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    async with TestSessionLocal() as session:
-        yield session
+    yield
 
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest.fixture
+async def db_session(db_schema: None) -> AsyncGenerator[AsyncSession]:
+    """Create a test database session rolled back after each test."""
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        # Commits inside the test only release a savepoint
+        session = AsyncSession(
+            bind=conn,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+    # Cached rows would outlive the rolled back transaction
+    clear_name_cache()
+
+
 def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
     """Clean up the async engine after all tests complete."""
     import asyncio
@@ -59,9 +89,9 @@ def test_cache() -> PokemonCache:
     return PokemonCache()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_pikachu_data() -> dict[str, Any]:
-    """Mock PokeAPI response for Pikachu."""
+    """Mock PokeAPI response for Pikachu, shared by all tests; don't mutate it."""
     return {
         "id": 25,
         "name": "pikachu",
@@ -78,9 +108,9 @@ def mock_pikachu_data() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_charizard_data() -> dict[str, Any]:
-    """Mock PokeAPI response for Charizard."""
+    """Mock PokeAPI response for Charizard, shared by all tests; don't mutate it."""
     return {
         "id": 6,
         "name": "charizard",
@@ -97,9 +127,9 @@ def mock_charizard_data() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_blastoise_data() -> dict[str, Any]:
-    """Mock PokeAPI response for Blastoise."""
+    """Mock PokeAPI response for Blastoise, shared by all tests; don't mutate it."""
     return {
         "id": 9,
         "name": "blastoise",
@@ -116,9 +146,9 @@ def mock_blastoise_data() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def pikachu() -> Pokemon:
-    """Create a test Pikachu Pokemon."""
+    """Create a test Pikachu Pokemon, shared by a module's tests; don't mutate it."""
     return Pokemon(
         id=1,
         pokeapi_id=25,
@@ -134,9 +164,9 @@ def pikachu() -> Pokemon:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def charizard() -> Pokemon:
-    """Create a test Charizard Pokemon."""
+    """Create a test Charizard Pokemon, shared by a module's tests; don't mutate it."""
     return Pokemon(
         id=2,
         pokeapi_id=6,
@@ -170,20 +200,16 @@ def blastoise() -> Pokemon:
     )
 
 
-class MockPokeAPIClient(PokeAPIClient):
-    """Mock PokeAPI client for testing."""
+class MockPokeAPIClient:
+    """Mock Pokemon provider for testing, without HTTP client or cache."""
 
     def __init__(self, mock_data: dict[str, dict[str, Any]]) -> None:
-        super().__init__(cache=PokemonCache())
         self.mock_data = mock_data
 
-    async def get_pokemon(self, name: str) -> Any:
+    async def get_pokemon(self, name: str) -> PokemonCreate:
         """Return mock data instead of calling API."""
-        name_lower = name.lower().strip()
-        if name_lower in self.mock_data:
-            return self._parse_pokemon_data(self.mock_data[name_lower])
-        from pokemon_battle.exceptions import PokemonNotFoundError
-
+        if name in self.mock_data:
+            return _parse_pokemon_data(self.mock_data[name])
         raise PokemonNotFoundError(name)
 
 
@@ -213,7 +239,7 @@ async def client(
     async def override_get_db() -> AsyncGenerator[AsyncSession]:
         yield db_session
 
-    def override_get_pokeapi_client() -> MockPokeAPIClient:
+    def override_get_pokeapi_client() -> PokemonProvider:
         return mock_pokeapi_client
 
     app.dependency_overrides[get_db] = override_get_db
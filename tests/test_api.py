@@ -1,6 +1,10 @@
 """Tests for REST API endpoints."""
 
+from typing import Any
+
 from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class TestHealthEndpoint:
@@ -42,6 +46,35 @@ class TestPokemonEndpoints:
         data = response.json()
         assert data["name"] == "pikachu"
 
+    async def test_get_pokemon_invalid_name(self, client: AsyncClient) -> None:
+        """Test that names PokeAPI could never match are rejected up front."""
+        response = await client.get("/api/v1/pokemon/pika_chu")
+        assert response.status_code == 422
+
+    async def test_get_pokemon_repeated(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        """Test that a warm repeat lookup is served from the name cache without SQL."""
+        # The first request inserts, the second reads the row back and caches it
+        first = await client.get("/api/v1/pokemon/pikachu")
+        await client.get("/api/v1/pokemon/pikachu")
+
+        statements: list[str] = []
+
+        def record(*args: Any) -> None:
+            statements.append(args[2])
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = await client.get("/api/v1/pokemon/pikachu")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        assert response.json() == first.json()
+        assert statements == []
+
     async def test_list_pokemon_empty(self, client: AsyncClient) -> None:
         """Test listing Pokemon when none exist."""
         response = await client.get("/api/v1/pokemon")
@@ -81,6 +114,30 @@ class TestBattleEndpoints:
         assert data["pokemon2_score"] > 0
         assert "battle_log" in data
 
+    async def test_create_battle_with_stored_pokemon(self, client: AsyncClient) -> None:
+        """Test a battle where only one Pokemon is already in the database."""
+        await client.get("/api/v1/pokemon/pikachu")
+
+        response = await client.post(
+            "/api/v1/battles",
+            json={"pokemon1_name": "charizard", "pokemon2_name": "Pikachu"},
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["pokemon1"]["name"] == "charizard"
+        assert data["pokemon2"]["name"] == "pikachu"
+
+        response = await client.get("/api/v1/pokemon")
+        assert sorted(p["name"] for p in response.json()) == ["charizard", "pikachu"]
+
+    async def test_create_battle_invalid_name(self, client: AsyncClient) -> None:
+        """Test that a blank Pokemon name is rejected."""
+        response = await client.post(
+            "/api/v1/battles",
+            json={"pokemon1_name": "   ", "pokemon2_name": "pikachu"},
+        )
+        assert response.status_code == 422
+
     async def test_create_battle_same_pokemon(self, client: AsyncClient) -> None:
         """Test that battling same Pokemon returns error."""
         response = await client.post(
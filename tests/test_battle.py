@@ -1,51 +1,87 @@
 """Tests for the battle algorithm."""
 
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from pokemon_battle.battle import (
+    BattleResult,
+    _resolve_battle,
+    _type_effectiveness,
     calculate_base_power,
+    calculate_battle_score,
     execute_battle,
+    get_battle_stats,
     get_type_effectiveness,
+    get_type_effectiveness_by_ids,
+    score_pairs,
 )
-from pokemon_battle.models import Pokemon
+from pokemon_battle.models import POKEMON_TYPES, Pokemon, get_type_ids
 
 
 class TestTypeEffectiveness:
     """Tests for type effectiveness calculations."""
 
-    def test_super_effective(self) -> None:
-        """Test super effective type matchup."""
-        # Fire is super effective against Grass
-        effectiveness = get_type_effectiveness(["fire"], ["grass"])
+    @pytest.mark.parametrize(
+        ("attacker", "defender", "expected"),
+        [
+            # Fire is super effective against Grass
+            pytest.param(["fire"], ["grass"], 2.0, id="super-effective"),
+            # Fire is not very effective against Water
+            pytest.param(["fire"], ["water"], 0.5, id="not-very-effective"),
+            # Normal vs Fighting (no special interaction)
+            pytest.param(["normal"], ["fighting"], 1.0, id="neutral"),
+            # Normal cannot hit Ghost
+            pytest.param(["normal"], ["ghost"], 0.0, id="immune"),
+            # Electric vs Water/Flying (both super effective)
+            pytest.param(["electric"], ["water", "flying"], 4.0, id="dual-type-defender"),
+            # Fire/Flying vs Grass (both super effective)
+            pytest.param(["fire", "flying"], ["grass"], 4.0, id="dual-type-attacker"),
+        ],
+    )
+    def test_matchup(self, attacker: list[str], defender: list[str], expected: float) -> None:
+        """Test the multiplier for single and dual type matchups."""
+        assert get_type_effectiveness(attacker, defender) == expected
+
+    def test_type_order_does_not_matter(self) -> None:
+        """Test that listing types in a different order gives the same multiplier."""
+        effectiveness = get_type_effectiveness(["flying", "fire"], ["grass"])
+        assert effectiveness == get_type_effectiveness(["fire", "flying"], ["grass"])
+
+    def test_cache_hit(self) -> None:
+        """Test that a repeated matchup, in any type order, is served from the cache."""
+        first = get_type_effectiveness(["fire", "flying"], ["grass"])
+        hits = _type_effectiveness.cache_info().hits
+        second = get_type_effectiveness(["flying", "fire"], ["grass"])
+
+        assert _type_effectiveness.cache_info().hits == hits + 1
+        assert second == first
+
+    def test_unknown_type_is_neutral(self) -> None:
+        """Test that types missing from the chart don't affect the multiplier."""
+        effectiveness = get_type_effectiveness(["fire", "shadow"], ["grass"])
         assert effectiveness == 2.0
 
-    def test_not_very_effective(self) -> None:
-        """Test not very effective type matchup."""
-        # Fire is not very effective against Water
-        effectiveness = get_type_effectiveness(["fire"], ["water"])
-        assert effectiveness == 0.5
-
-    def test_neutral(self) -> None:
-        """Test neutral type matchup."""
-        # Normal vs Fighting (no special interaction)
-        effectiveness = get_type_effectiveness(["normal"], ["fighting"])
-        assert effectiveness == 1.0
-
-    def test_immune(self) -> None:
-        """Test immunity type matchup."""
-        # Normal cannot hit Ghost
-        effectiveness = get_type_effectiveness(["normal"], ["ghost"])
-        assert effectiveness == 0.0
-
-    def test_dual_type_defender(self) -> None:
-        """Test effectiveness against dual type defender."""
-        # Electric vs Water/Flying (both super effective)
-        effectiveness = get_type_effectiveness(["electric"], ["water", "flying"])
-        assert effectiveness == 4.0
-
-    def test_dual_type_attacker(self) -> None:
-        """Test effectiveness with dual type attacker."""
-        # Fire/Flying vs Grass
-        effectiveness = get_type_effectiveness(["fire", "flying"], ["grass"])
-        assert effectiveness == 4.0  # Both are super effective
+    def test_by_ids_matches_names(self) -> None:
+        """Test that the index-based lookup agrees with the name-based one."""
+        effectiveness = get_type_effectiveness_by_ids(
+            get_type_ids(["electric"]), get_type_ids(["water", "flying"])
+        )
+        assert effectiveness == get_type_effectiveness(["electric"], ["water", "flying"])
+
+    def test_pokemon_type_ids(self) -> None:
+        """Test that type ids are kept in step with the types column."""
+        pokemon = Pokemon(name="charizard", types="fire,flying")
+        assert pokemon.type_ids == get_type_ids(["fire", "flying"])
+        pokemon.types = "water"
+        assert pokemon.type_ids == get_type_ids(["water"])
+
+    def test_pokemon_type_ids_not_backfilled(self) -> None:
+        """Test that a row with NULL type id columns falls back to its types string."""
+        pokemon = Pokemon(name="charizard", types="fire,flying")
+        pokemon.type1_id = pokemon.type2_id = None
+        assert pokemon.type_ids == get_type_ids(["fire", "flying"])
 
 
 class TestBasePower:
@@ -59,10 +95,15 @@ class TestBasePower:
         # Power: (35 * 0.5 + 52.5 + 45 + 90) / 4 = 51.25
         assert abs(power - 51.25) < 0.01
 
-    def test_base_power_higher_stats(self, charizard: Pokemon) -> None:
+    def test_base_power_higher_stats(self, pikachu: Pokemon, charizard: Pokemon) -> None:
         """Test that higher stats result in higher power."""
-        pikachu = Pokemon(
-            id=1,
+        pikachu_power = calculate_base_power(pikachu)
+        charizard_power = calculate_base_power(charizard)
+        assert charizard_power > pikachu_power
+
+    async def test_stored_base_power_matches(self, db_session: AsyncSession) -> None:
+        """Test that the generated base_power column agrees with the Python formula."""
+        pokemon = Pokemon(
             pokeapi_id=25,
             name="pikachu",
             hp=35,
@@ -73,33 +114,51 @@ class TestBasePower:
             speed=90,
             types="electric",
         )
-        pikachu_power = calculate_base_power(pikachu)
-        charizard_power = calculate_base_power(charizard)
-        assert charizard_power > pikachu_power
+        assert pokemon.base_power is None
+
+        db_session.add(pokemon)
+        await db_session.flush()
+
+        assert pokemon.base_power == calculate_base_power(pokemon)
+
+
+@pytest.fixture(scope="module")
+def pika_char_result(pikachu: Pokemon, charizard: Pokemon) -> BattleResult:
+    """Run the Pikachu vs Charizard battle once for the tests that only inspect it."""
+    return execute_battle(pikachu, charizard)
 
 
 class TestExecuteBattle:
     """Tests for battle execution."""
 
-    def test_battle_has_winner(self, pikachu: Pokemon, charizard: Pokemon) -> None:
+    def test_battle_has_winner(self, pika_char_result: BattleResult) -> None:
         """Test that a battle produces a winner."""
-        result = execute_battle(pikachu, charizard)
         # Charizard should generally win due to higher stats
-        assert result.winner is not None or result.is_draw
+        assert pika_char_result.winner is not None or pika_char_result.is_draw
 
-    def test_battle_scores_calculated(self, pikachu: Pokemon, charizard: Pokemon) -> None:
+    def test_battle_scores_calculated(self, pika_char_result: BattleResult) -> None:
         """Test that battle scores are calculated."""
-        result = execute_battle(pikachu, charizard)
-        assert result.pokemon1_score > 0
-        assert result.pokemon2_score > 0
+        assert pika_char_result.pokemon1_score > 0
+        assert pika_char_result.pokemon2_score > 0
 
-    def test_battle_log_generated(self, pikachu: Pokemon, charizard: Pokemon) -> None:
+    def test_battle_log_generated(self, pika_char_result: BattleResult) -> None:
         """Test that battle log is generated."""
-        result = execute_battle(pikachu, charizard)
-        assert len(result.battle_log) > 0
-        assert "BATTLE:" in result.battle_log
-        assert "pikachu" in result.battle_log.lower()
-        assert "charizard" in result.battle_log.lower()
+        battle_log = pika_char_result.battle_log
+        assert len(battle_log) > 0
+        assert "BATTLE:" in battle_log
+        assert "pikachu" in battle_log.lower()
+        assert "charizard" in battle_log.lower()
+
+    def test_battle_without_log(self, pikachu: Pokemon, charizard: Pokemon) -> None:
+        """Test that skipping the log doesn't change the outcome."""
+        full = execute_battle(pikachu, charizard)
+        fast = execute_battle(pikachu, charizard, build_log=False)
+
+        assert fast.battle_log == ""
+        assert fast.winner is full.winner
+        assert fast.pokemon1_score == full.pokemon1_score
+        assert fast.pokemon2_score == full.pokemon2_score
+        assert fast.is_draw == full.is_draw
 
     def test_type_advantage_affects_outcome(
         self,
@@ -114,21 +173,77 @@ class TestExecuteBattle:
         if not result.is_draw:
             assert result.winner == blastoise
 
-    def test_battle_symmetric_opponents(self, pikachu: Pokemon) -> None:
-        """Test battle with identical Pokemon creates a draw."""
-        pikachu2 = Pokemon(
-            id=2,
-            pokeapi_id=25,
-            name="pikachu2",
-            hp=pikachu.hp,
-            attack=pikachu.attack,
-            defense=pikachu.defense,
-            special_attack=pikachu.special_attack,
-            special_defense=pikachu.special_defense,
-            speed=pikachu.speed,
-            types=pikachu.types,
+    def test_repeat_battle_is_memoized(self, charizard: Pokemon, blastoise: Pokemon) -> None:
+        """Test that a repeated matchup is served from the cache with the right winner."""
+        first = execute_battle(charizard, blastoise)
+        hits = _resolve_battle.cache_info().hits
+        second = execute_battle(charizard, blastoise)
+
+        assert _resolve_battle.cache_info().hits == hits + 1
+        assert second.battle_log == first.battle_log
+        assert second.winner is first.winner
+
+    @given(
+        stats=st.tuples(*[st.integers(min_value=1, max_value=255)] * 6),
+        types=st.sampled_from(POKEMON_TYPES),
+    )
+    @settings(max_examples=25, deadline=None)
+    def test_battle_symmetric_opponents(self, stats: tuple[int, ...], types: str) -> None:
+        """Test that Pokemon with identical stats and types always draw."""
+        hp, attack, defense, special_attack, special_defense, speed = stats
+        pokemon1, pokemon2 = (
+            Pokemon(
+                id=pokemon_id,
+                pokeapi_id=pokemon_id,
+                name=f"mirror{pokemon_id}",
+                hp=hp,
+                attack=attack,
+                defense=defense,
+                special_attack=special_attack,
+                special_defense=special_defense,
+                speed=speed,
+                types=types,
+            )
+            for pokemon_id in (1, 2)
         )
-        result = execute_battle(pikachu, pikachu2)
+        result = execute_battle(pokemon1, pokemon2)
         # Same stats should result in a draw
         assert result.is_draw
         assert result.winner is None
+
+
+class TestBattleScore:
+    """Tests for scoring a single attack."""
+
+    def test_unflushed_pokemon_matches_snapshot(self, pikachu: Pokemon, charizard: Pokemon) -> None:
+        """Test that a Pokemon without stored base power scores like its snapshot."""
+        assert pikachu.base_power is None
+        score, _ = calculate_battle_score(pikachu, charizard, build_log=False)
+        expected, _ = calculate_battle_score(
+            get_battle_stats(pikachu), get_battle_stats(charizard), build_log=False
+        )
+        assert score == expected
+
+
+class TestScorePairs:
+    """Tests for bulk scoring of many matchups."""
+
+    def test_matches_single_scores(
+        self, pikachu: Pokemon, charizard: Pokemon, blastoise: Pokemon
+    ) -> None:
+        """Test that each bulk score equals the single-battle score."""
+        attackers = [pikachu, charizard, blastoise]
+        defenders = [blastoise, blastoise, charizard]
+
+        scores = score_pairs(attackers, defenders)
+
+        for attacker, defender, score in zip(attackers, defenders, scores, strict=True):
+            expected, _ = calculate_battle_score(
+                get_battle_stats(attacker), get_battle_stats(defender), build_log=False
+            )
+            assert score == expected
+
+    def test_mismatched_lengths(self, pikachu: Pokemon, charizard: Pokemon) -> None:
+        """Test that unpaired attackers are rejected."""
+        with pytest.raises(ValueError):
+            score_pairs([pikachu, charizard], [charizard])
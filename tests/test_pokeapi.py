@@ -1,9 +1,35 @@
 """Tests for PokeAPI client."""
 
-import time
+import asyncio
 from typing import Any
 
-from pokemon_battle.pokeapi import PokeAPIClient, PokemonCache
+import httpx
+import pytest
+
+from pokemon_battle.exceptions import PokemonNotFoundError
+from pokemon_battle.pokeapi import (
+    _FREQUENCY_WINDOW,
+    PokeAPIClient,
+    PokemonCache,
+    _parse_pokemon_data,
+    get_pokeapi_client,
+)
+from pokemon_battle.schemas import PokemonCreate
+
+
+def _pokemon(name: str) -> PokemonCreate:
+    """Build a minimal parsed Pokemon to store in the cache."""
+    return PokemonCreate(
+        pokeapi_id=1,
+        name=name,
+        hp=1,
+        attack=1,
+        defense=1,
+        special_attack=1,
+        special_defense=1,
+        speed=1,
+        types="normal",
+    )
 
 
 class TestPokemonCache:
@@ -12,9 +38,9 @@ class TestPokemonCache:
     def test_set_and_get(self) -> None:
         """Test setting and getting cache values."""
         cache = PokemonCache(ttl=60)
-        cache.set("pikachu", {"name": "pikachu"})
+        cache.set("pikachu", _pokemon("pikachu"))
         result = cache.get("pikachu")
-        assert result == {"name": "pikachu"}
+        assert result == _pokemon("pikachu")
 
     def test_get_missing_key(self) -> None:
         """Test getting a missing key returns None."""
@@ -24,21 +50,88 @@ class TestPokemonCache:
 
     def test_cache_expiration(self) -> None:
         """Test that cache entries expire."""
-        cache = PokemonCache(ttl=1)  # 1 second TTL
-        cache.set("pikachu", {"name": "pikachu"})
+        now = [0.0]
+        cache = PokemonCache(ttl=1, time_func=lambda: now[0])  # 1 second TTL
+        cache.set("pikachu", _pokemon("pikachu"))
 
-        # Should be available immediately
+        # Should be available before the TTL elapses
+        now[0] += 0.5
         assert cache.get("pikachu") is not None
 
-        # Wait for expiration
-        time.sleep(1.1)
+        # Advance the clock past expiration
+        now[0] += 1.0
         assert cache.get("pikachu") is None
 
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that a full cache evicts the entry used longest ago."""
+        cache = PokemonCache(ttl=60, max_size=2)
+        cache.set("pikachu", _pokemon("pikachu"))
+        cache.set("charizard", _pokemon("charizard"))
+
+        # Touch pikachu so charizard becomes the eviction candidate
+        cache.get("pikachu")
+        cache.set("blastoise", _pokemon("blastoise"))
+
+        assert cache.get("charizard") is None
+        assert cache.get("pikachu") is not None
+        assert cache.get("blastoise") is not None
+
+    def test_one_off_lookup_does_not_evict_popular_entry(self) -> None:
+        """Test that a full cache keeps an often-used entry over a newcomer seen once."""
+        cache = PokemonCache(ttl=60, max_size=1)
+        cache.set("pikachu", _pokemon("pikachu"))
+        for _ in range(3):
+            cache.get("pikachu")
+
+        # A miss followed by a fetch, as PokeAPIClient does for an obscure Pokemon
+        assert cache.get("magikarp") is None
+        cache.set("magikarp", _pokemon("magikarp"))
+
+        assert cache.get("pikachu") is not None
+        assert "magikarp" not in cache._cache
+
+    def test_expired_entries_free_slots(self) -> None:
+        """Test that storing drops expired entries instead of letting them hold slots."""
+        now = [0.0]
+        cache = PokemonCache(ttl=1, max_size=2, time_func=lambda: now[0])
+        cache.set("pikachu", _pokemon("pikachu"))
+        cache.set("charizard", _pokemon("charizard"))
+        # Popular enough that a newcomer couldn't evict them while they were live
+        for _ in range(3):
+            cache.get("pikachu")
+            cache.get("charizard")
+
+        now[0] += 2.0
+        cache.set("blastoise", _pokemon("blastoise"))
+
+        assert list(cache._cache) == ["blastoise"]
+
+    def test_negative_entry_raises_not_found(self) -> None:
+        """Test that a name cached as missing raises instead of returning None."""
+        cache = PokemonCache(ttl=60, negative_ttl=60)
+        cache.set_negative("fakemon")
+
+        with pytest.raises(PokemonNotFoundError):
+            cache.get("fakemon")
+
+    def test_lookup_counts_halved_each_window(self) -> None:
+        """Test that counts are halved once per window and keys seen once are dropped."""
+        cache = PokemonCache(ttl=60, max_size=2)
+        for _ in range(9):
+            cache.get("pikachu")
+        cache.get("magikarp")
+        # Complete the window of max_size * _FREQUENCY_WINDOW lookups
+        for _ in range(2 * _FREQUENCY_WINDOW - 10):
+            cache.get("charizard")
+
+        assert cache._frequency == {"pikachu": 4, "charizard": 5}
+        assert cache._lookups == 0
+
     def test_clear_cache(self) -> None:
         """Test clearing the cache."""
         cache = PokemonCache(ttl=60)
-        cache.set("pikachu", {"name": "pikachu"})
-        cache.set("charizard", {"name": "charizard"})
+        cache.set("pikachu", _pokemon("pikachu"))
+        cache.set("charizard", _pokemon("charizard"))
 
         cache.clear()
 
@@ -51,8 +144,7 @@ class TestPokeAPIClientParsing:
 
     def test_parse_pokemon_data(self, mock_pikachu_data: dict[str, Any]) -> None:
         """Test parsing Pokemon data from API response."""
-        client = PokeAPIClient()
-        result = client._parse_pokemon_data(mock_pikachu_data)
+        result = _parse_pokemon_data(mock_pikachu_data)
 
         assert result.pokeapi_id == 25
         assert result.name == "pikachu"
@@ -67,15 +159,139 @@ class TestPokeAPIClientParsing:
 
     def test_parse_dual_type_pokemon(self, mock_charizard_data: dict[str, Any]) -> None:
         """Test parsing dual-type Pokemon data."""
-        client = PokeAPIClient()
-        result = client._parse_pokemon_data(mock_charizard_data)
+        result = _parse_pokemon_data(mock_charizard_data)
 
         assert result.types == "fire,flying"
 
+    def test_parse_reordered_stats(self, mock_pikachu_data: dict[str, Any]) -> None:
+        """Test that stats are matched by name, in any order."""
+        data = {**mock_pikachu_data, "stats": mock_pikachu_data["stats"][::-1][:5]}
+        result = _parse_pokemon_data(data)
+
+        assert result.hp == 0  # hp was dropped along with the reordering
+        assert result.attack == 55
+        assert result.speed == 90
+
     def test_parse_missing_sprite(self, mock_pikachu_data: dict[str, Any]) -> None:
         """Test parsing Pokemon with missing sprite."""
-        mock_pikachu_data["sprites"] = {}
-        client = PokeAPIClient()
-        result = client._parse_pokemon_data(mock_pikachu_data)
+        data = {**mock_pikachu_data, "sprites": {}}
+        result = _parse_pokemon_data(data)
 
         assert result.sprite_url is None
+
+
+class TestPokeAPIClientFetching:
+    """Tests for fetching through the shared HTTP client."""
+
+    @pytest.fixture
+    def requested_paths(self) -> list[str]:
+        """Collect the paths requested from the mock PokeAPI."""
+        return []
+
+    @pytest.fixture
+    def pokeapi_client(
+        self, mock_pikachu_data: dict[str, Any], requested_paths: list[str]
+    ) -> PokeAPIClient:
+        """Create a client whose HTTP pool talks to a mock PokeAPI."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requested_paths.append(request.url.path)
+            # Yield so concurrent callers overlap with the request in flight
+            await asyncio.sleep(0)
+            if request.url.path.endswith("/pokemon/pikachu"):
+                return httpx.Response(200, json=mock_pikachu_data)
+            return httpx.Response(404)
+
+        client = PokeAPIClient(cache=PokemonCache(ttl=60))
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(handler)
+        )
+        return client
+
+    async def test_fetch_and_cache(
+        self, pokeapi_client: PokeAPIClient, requested_paths: list[str]
+    ) -> None:
+        """Test that a fetched Pokemon is served from cache on the next call."""
+        first = await pokeapi_client.get_pokemon("pikachu")
+        second = await pokeapi_client.get_pokemon("pikachu")
+        await pokeapi_client.aclose()
+
+        assert first == second
+        assert first.name == "pikachu"
+        assert len(requested_paths) == 1
+
+    async def test_cache_stores_parsed_pokemon(self, pokeapi_client: PokeAPIClient) -> None:
+        """Test that the cache holds the parsed result, returned as is on a hit."""
+        fetched = await pokeapi_client.get_pokemon("pikachu")
+        await pokeapi_client.aclose()
+
+        assert pokeapi_client.cache.get("pikachu") is fetched
+        assert await pokeapi_client.get_pokemon("pikachu") is fetched
+
+    async def test_concurrent_fetches_coalesce(
+        self, pokeapi_client: PokeAPIClient, requested_paths: list[str]
+    ) -> None:
+        """Test that concurrent fetches of one name share a single request."""
+        results = await asyncio.gather(*(pokeapi_client.get_pokemon("pikachu") for _ in range(3)))
+        await pokeapi_client.aclose()
+
+        assert all(result.name == "pikachu" for result in results)
+        assert len(requested_paths) == 1
+        assert not pokeapi_client._inflight
+
+    async def test_cancelled_first_caller_does_not_cancel_waiters(
+        self, pokeapi_client: PokeAPIClient, requested_paths: list[str]
+    ) -> None:
+        """Test that cancelling the caller that started a fetch leaves others waiting on it."""
+        first = asyncio.create_task(pokeapi_client.get_pokemon("pikachu"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(pokeapi_client.get_pokemon("pikachu"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        result = await second
+        await pokeapi_client.aclose()
+
+        assert first.cancelled()
+        assert result.name == "pikachu"
+        assert len(requested_paths) == 1
+        assert not pokeapi_client._inflight
+
+    async def test_concurrent_not_found_coalesce(
+        self, pokeapi_client: PokeAPIClient, requested_paths: list[str]
+    ) -> None:
+        """Test that every caller waiting on a failed fetch gets its error."""
+        results = await asyncio.gather(
+            *(pokeapi_client.get_pokemon("fakemon") for _ in range(2)), return_exceptions=True
+        )
+        await pokeapi_client.aclose()
+
+        assert all(isinstance(result, PokemonNotFoundError) for result in results)
+        assert len(requested_paths) == 1
+
+    async def test_fetch_not_found(
+        self, pokeapi_client: PokeAPIClient, requested_paths: list[str]
+    ) -> None:
+        """Test that a 404 from PokeAPI raises PokemonNotFoundError and is cached."""
+        for _ in range(2):
+            with pytest.raises(PokemonNotFoundError):
+                await pokeapi_client.get_pokemon("fakemon")
+        await pokeapi_client.aclose()
+
+        assert len(requested_paths) == 1
+
+    async def test_pool_opened_on_first_use(self) -> None:
+        """Test that no HTTP pool is held until a fetch needs one, and aclose drops it."""
+        client = PokeAPIClient(cache=PokemonCache(ttl=60))
+        assert client._client is None
+
+        http_client = client._get_client()
+        assert client._get_client() is http_client
+
+        await client.aclose()
+        assert client._client is None
+        assert http_client.is_closed
+
+    def test_client_is_shared(self) -> None:
+        """Test that the dependency returns one process-wide client."""
+        assert get_pokeapi_client() is get_pokeapi_client()
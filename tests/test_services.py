@@ -0,0 +1,270 @@
+"""Tests for business logic services."""
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pokemon_battle.battle import get_battle_engine
+from pokemon_battle.exceptions import SamePokemonError
+from pokemon_battle.models import Battle, Pokemon
+from pokemon_battle.protocols import PokemonProvider
+from pokemon_battle.schemas import PokemonCreate
+from pokemon_battle.services import _NAME_CACHE, BattleService, PokemonService
+
+
+class SlowProvider:
+    """Pokemon provider wrapper that records how many fetches overlap."""
+
+    def __init__(self, provider: PokemonProvider) -> None:
+        self.provider = provider
+        self.active = 0
+        self.max_active = 0
+
+    async def get_pokemon(self, name: str) -> PokemonCreate:
+        """Fetch from the wrapped provider after yielding, like a network call would."""
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0)
+            return await self.provider.get_pokemon(name)
+        finally:
+            self.active -= 1
+
+
+class AliasProvider:
+    """Pokemon provider wrapper that resolves PokeAPI ids to names, as PokeAPI does."""
+
+    def __init__(self, provider: PokemonProvider, aliases: dict[str, str]) -> None:
+        self.provider = provider
+        self.aliases = aliases
+
+    async def get_pokemon(self, name: str) -> PokemonCreate:
+        """Fetch the wrapped provider's Pokemon for name or its alias."""
+        return await self.provider.get_pokemon(self.aliases.get(name, name))
+
+
+class TestGetOrFetchMany:
+    """Tests for loading several Pokemon at once."""
+
+    async def test_misses_fetched_concurrently(
+        self,
+        db_session: AsyncSession,
+        mock_pokeapi_client: PokemonProvider,
+    ) -> None:
+        """Test that Pokemon missing from the database are fetched in parallel."""
+        provider = SlowProvider(mock_pokeapi_client)
+        service = PokemonService(db_session, provider)
+
+        pokemon = await service.get_or_fetch_many(["pikachu", "charizard"])
+
+        assert sorted(pokemon) == ["charizard", "pikachu"]
+        assert provider.max_active == 2
+
+    async def test_stored_pokemon_not_refetched(
+        self,
+        db_session: AsyncSession,
+        mock_pokeapi_client: PokemonProvider,
+    ) -> None:
+        """Test that only names missing from the database reach the provider."""
+        provider = SlowProvider(mock_pokeapi_client)
+        service = PokemonService(db_session, provider)
+        await service.get_or_fetch_pokemon("pikachu")
+
+        pokemon = await service.get_or_fetch_many(["pikachu", "charizard"])
+
+        assert pokemon["pikachu"].pokeapi_id == 25
+        assert provider.max_active == 1
+
+    async def test_aliases_share_one_row(
+        self,
+        db_session: AsyncSession,
+        mock_pokeapi_client: PokemonProvider,
+    ) -> None:
+        """Test that an id and a name for the same cold Pokemon insert a single row."""
+        provider = AliasProvider(mock_pokeapi_client, {"25": "pikachu"})
+        service = PokemonService(db_session, provider)
+
+        pokemon = await service.get_or_fetch_many(["25", "pikachu"])
+
+        assert pokemon["25"] is pokemon["pikachu"]
+        count = await db_session.scalar(select(func.count()).select_from(Pokemon))
+        assert count == 1
+
+    async def test_alias_of_stored_pokemon(
+        self,
+        db_session: AsyncSession,
+        mock_pokeapi_client: PokemonProvider,
+    ) -> None:
+        """Test that an id for a Pokemon stored under its name maps to the stored row."""
+        provider = AliasProvider(mock_pokeapi_client, {"25": "pikachu"})
+        service = PokemonService(db_session, provider)
+        stored = await service.get_or_fetch_pokemon("pikachu")
+
+        pokemon = await service.get_or_fetch_many(["25"])
+
+        assert pokemon["25"] is stored
+        count = await db_session.scalar(select(func.count()).select_from(Pokemon))
+        assert count == 1
+
+
+class TestNameCache:
+    """Tests for the process-wide Pokemon name cache."""
+
+    async def test_warm_lookup_runs_no_sql(
+        self,
+        db_session: AsyncSession,
+        mock_pokeapi_client: PokemonProvider,
+    ) -> None:
+        """Test that a Pokemon cached by an earlier read is served without a query."""
+        service = PokemonService(db_session, mock_pokeapi_client)
+        # The first lookup inserts, the second reads the row back and caches it
+        stored = await service.get_or_fetch_pokemon("pikachu")
+        await service.get_or_fetch_many(["pikachu"])
+
+        statements: list[str] = []
+
+        def record(*args: Any) -> None:
+            statements.append(args[2])
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            pokemon = await service.get_or_fetch_many(["pikachu"])
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert pokemon["pikachu"] is stored
+        assert statements == []
+
+    async def test_expired_entry_reloaded(
+        self,
+        db_session: AsyncSession,
+        mock_pokeapi_client: PokemonProvider,
+    ) -> None:
+        """Test that an expired entry is dropped and the Pokemon read from the database."""
+        service = PokemonService(db_session, mock_pokeapi_client)
+        await service.get_or_fetch_pokemon("pikachu")
+        await service.get_or_fetch_many(["pikachu"])
+
+        _, cached = _NAME_CACHE["pikachu"]
+        _NAME_CACHE["pikachu"] = (time.monotonic() - 1, cached)
+
+        statements: list[str] = []
+
+        def record(*args: Any) -> None:
+            statements.append(args[2])
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            pokemon = await service.get_or_fetch_many(["pikachu"])
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert pokemon["pikachu"].pokeapi_id == 25
+        assert len(statements) == 1
+        assert statements[0].startswith("SELECT")
+        # Reading the row back caches it again with a fresh expiry
+        expires_at, _ = _NAME_CACHE["pikachu"]
+        assert expires_at > time.monotonic()
+
+
+class TestGetPokemonById:
+    """Tests for primary key lookups."""
+
+    async def test_loaded_pokemon_served_without_query(
+        self,
+        db_session: AsyncSession,
+        mock_pokeapi_client: PokemonProvider,
+    ) -> None:
+        """Test that a Pokemon already in the session is returned without SQL."""
+        service = PokemonService(db_session, mock_pokeapi_client)
+        pikachu = await service.get_or_fetch_pokemon("pikachu")
+
+        statements: list[str] = []
+
+        def record(*args: Any) -> None:
+            statements.append(args[2])
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            found = await service.get_pokemon_by_id(pikachu.id)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert found is pikachu
+        assert statements == []
+
+
+class TestExecuteBattle:
+    """Tests for recording battles."""
+
+    async def test_cold_battle_inserts_pokemon_in_one_statement(
+        self,
+        db_session: AsyncSession,
+        mock_pokeapi_client: PokemonProvider,
+    ) -> None:
+        """Test that both new Pokemon are inserted by a single statement."""
+        pokemon_service = PokemonService(db_session, mock_pokeapi_client)
+        battle_service = BattleService(db_session, pokemon_service, get_battle_engine())
+
+        statements: list[str] = []
+
+        def record(*args: Any) -> None:
+            statements.append(args[2])
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            battle = await battle_service.execute_battle("pikachu", "charizard")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        inserts = [s for s in statements if s.startswith("INSERT")]
+        assert len(inserts) == 2
+        assert inserts[0].startswith("INSERT INTO pokemon")
+        assert inserts[1].startswith("INSERT INTO battles")
+        assert battle.pokemon1.id is not None
+        assert battle.pokemon2.id is not None
+
+    async def test_alias_of_same_pokemon_rejected(
+        self,
+        db_session: AsyncSession,
+        mock_pokeapi_client: PokemonProvider,
+    ) -> None:
+        """Test that an id and a name for the same Pokemon can't battle each other."""
+        provider = AliasProvider(mock_pokeapi_client, {"25": "pikachu"})
+        pokemon_service = PokemonService(db_session, provider)
+        battle_service = BattleService(db_session, pokemon_service, get_battle_engine())
+
+        with pytest.raises(SamePokemonError):
+            await battle_service.execute_battle("pikachu", "25")
+
+        count = await db_session.scalar(select(func.count()).select_from(Battle))
+        assert count == 0
+
+    async def test_predict_matches_execute_without_recording(
+        self,
+        db_session: AsyncSession,
+        mock_pokeapi_client: PokemonProvider,
+    ) -> None:
+        """Test that a prediction skips the log and the battle row but agrees on the outcome."""
+        pokemon_service = PokemonService(db_session, mock_pokeapi_client)
+        battle_service = BattleService(db_session, pokemon_service, get_battle_engine())
+
+        prediction = await battle_service.predict_battle("pikachu", "charizard")
+
+        assert prediction.battle_log == ""
+        count = await db_session.scalar(select(func.count()).select_from(Battle))
+        assert count == 0
+
+        battle = await battle_service.execute_battle("pikachu", "charizard")
+
+        assert battle.winner is prediction.winner
+        assert battle.pokemon1_score == prediction.pokemon1_score
+        assert battle.pokemon2_score == prediction.pokemon2_score